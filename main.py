@@ -1,26 +1,126 @@
-from fastapi import FastAPI
-from scraper import scrape_jobs_by_keyword
+import hashlib
+import logging
+import os
+from typing import Any, Optional, Tuple
+
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from scraper import invalid_location_response, iter_jobs_by_keyword, json_default, parse_keywords, scrape_jobs_by_keyword_async, validate_location
 import uvicorn
 
+logger = logging.getLogger(__name__)
+
+# Scrape results are cached for at most this long (and never longer than hours_old)
+CACHE_TTL_SECONDS = 600
+
+# Seconds to wait on Redis before treating the cache as unavailable
+REDIS_TIMEOUT_SECONDS = 0.5
+
+# Caching is enabled only when a Redis URL is configured
+REDIS_URL = os.getenv("REDIS_URL")
+redis_client = aioredis.from_url(
+    REDIS_URL,
+    socket_timeout=REDIS_TIMEOUT_SECONDS,
+    socket_connect_timeout=REDIS_TIMEOUT_SECONDS
+) if REDIS_URL else None
+
+
+class JobsJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that also serializes pandas values (e.g. Timestamp) jobspy may return.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
 app = FastAPI(
     title="Job Scraper API",
     description="API for scraping job listings from LinkedIn and Indeed",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=JobsJSONResponse
 )
 
 
+def _cache_key(keywords: Tuple[str, ...], location: str, results: int, hours_old: int) -> str:
+    """
+    Build the Redis key for a /scrape query.
+    Keywords keep their request order, since the cached body echoes them back.
+    """
+    query = orjson.dumps({"k": keywords, "l": location, "r": results, "h": hours_old})
+    return "scrape:" + hashlib.blake2b(query).hexdigest()
+
+
+async def _cache_get(key: str) -> Optional[bytes]:
+    """
+    Fetch a cached response body, treating Redis errors as a cache miss.
+    """
+    try:
+        return await redis_client.get(key)
+    except RedisError as e:
+        logger.warning("Cache lookup failed: %s", e)
+        return None
+
+
+async def _cache_set(key: str, body: bytes, ttl: int) -> None:
+    """
+    Store a response body, ignoring Redis errors so the request still succeeds.
+    """
+    try:
+        await redis_client.set(key, body, ex=ttl)
+    except RedisError as e:
+        logger.warning("Cache store failed: %s", e)
+
+
 @app.get("/scrape")
-def fetch_jobs(keywords: str = "Software Engineer,React,React Native", location: str = "Remote", results: int = 50, hours_old: int = 48):
+async def fetch_jobs(keywords: str = "Software Engineer,React,React Native", location: str = "Remote", results: int = 50, hours_old: int = 48):
+
+    keywords_list = parse_keywords(keywords)
 
-    keywords_list = [k.strip() for k in keywords.split(",")]
-    result = scrape_jobs_by_keyword(
+    key = None
+    if redis_client is not None:
+        key = _cache_key(keywords_list, location, results, hours_old)
+        cached = await _cache_get(key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+    result = await scrape_jobs_by_keyword_async(
         keywords=keywords_list,
         location=location,
         results_wanted=results,
         hours_old=hours_old
     )
-    
-    return result
+
+    # Returning the response directly skips FastAPI's jsonable_encoder walk over every job
+    response = JobsJSONResponse(result)
+
+    # Only successful scrapes are cached; empty results may be a transient failure
+    ttl = min(hours_old * 3600, CACHE_TTL_SECONDS)
+    if key is not None and result["status"] == "success" and ttl > 0:
+        await _cache_set(key, response.body, ttl)
+
+    return response
+
+
+@app.get("/scrape/stream")
+async def stream_jobs(keywords: str = "Software Engineer,React,React Native", location: str = "Remote", results: int = 50, hours_old: int = 48):
+    """
+    Stream jobs as NDJSON (one job per line) as each site finishes scraping.
+    """
+    keywords_list = parse_keywords(keywords)
+
+    is_valid, normalized_location = validate_location(location)
+    if not is_valid:
+        return JobsJSONResponse(invalid_location_response(keywords_list, location))
+
+    async def generate():
+        async for jobs_list in iter_jobs_by_keyword(keywords_list, normalized_location, results, hours_old):
+            yield b"".join(orjson.dumps(job, default=json_default, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n" for job in jobs_list)
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @app.get("/health")
@@ -30,5 +130,6 @@ def health_check():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-    
\ No newline at end of file
+    # One worker process per core so concurrent requests don't share a GIL
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=workers, loop="uvloop", http="httptools", log_level="warning")
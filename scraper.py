@@ -1,19 +1,69 @@
-import json
+import asyncio
+import logging
 import sys
-from typing import List, Optional
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from datetime import date
+from functools import lru_cache
+from itertools import product
+from typing import AsyncIterator, List, Optional, Tuple
 from jobspy import scrape_jobs
-import pandas as pd
 import numpy as np
+import orjson
+
+# Progress and errors go through logging; the CLI enables INFO output, while
+# the API leaves the default WARNING level so per-scrape messages are skipped
+logger = logging.getLogger(__name__)
 
 # Valid countries according to python-jobspy - filtered for high salary countries accessible to Lebanese citizens
-VALID_COUNTRIES = {
+VALID_COUNTRIES = frozenset({
     "australia", "austria", "bahrain", "belgium", "canada", "denmark", "finland", 
     "france", "germany", "hong kong", "ireland", "japan", "kuwait", "lebanon", 
     "luxembourg", "netherlands", "new zealand", "norway", "oman", "qatar", 
     "saudi arabia", "singapore", "south korea", "sweden", "switzerland", "taiwan", 
     "uk", "united kingdom", "usa", "us", "united states", "united arab emirates", 
     "worldwide"
+})
+
+# Precomputed for the invalid-location error response; a tuple so every response can share it safely
+_SORTED_COUNTRIES = tuple(sorted(VALID_COUNTRIES))
+_ERROR_HINT = ", ".join(_SORTED_COUNTRIES[:20])
+
+# Job boards scraped when the caller doesn't pick any
+DEFAULT_SITE_NAMES = ["linkedin", "indeed", "glassdoor", "zip_recruiter", "google"]
+
+# Upper bound on keywords scraped at once by the synchronous scrape_jobs_by_keyword
+MAX_KEYWORD_WORKERS = 8
+
+# Upper bound on (keyword, site) scrapes running at once for a single API request
+MAX_CONCURRENT_SCRAPES = 20
+
+# Per-site (max concurrent scrapes, scrape starts per second), shared by all
+# requests in a worker so each board stays under its rate-limit threshold
+SITE_LIMITS = {
+    "linkedin": (3, 0.5),
+    "indeed": (5, 2.0),
+    "glassdoor": (3, 1.0),
+    "zip_recruiter": (3, 1.0),
+    "google": (5, 2.0),
 }
+DEFAULT_SITE_LIMIT = (3, 1.0)
+
+# Per-attempt timeout (seconds) and retry policy for a single (keyword, site) scrape;
+# the timeout also sets the batch deadline in the synchronous scrape_jobs_by_keyword
+SCRAPE_TIMEOUT = 60
+SCRAPE_ATTEMPTS = 3
+RETRY_BACKOFF = 0.3
+
+# Dedicated pool for async scrapes, sized to the per-site caps so a scrape
+# that has passed its limits doesn't queue behind unrelated work for a thread.
+# Site slots stay held until their thread finishes, so this bound holds even
+# when a board hangs past SCRAPE_TIMEOUT
+_SCRAPE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(MAX_CONCURRENT_SCRAPES, sum(max_concurrent for max_concurrent, _ in SITE_LIMITS.values())),
+    thread_name_prefix="scrape"
+)
 
 # Common location aliases
 LOCATION_ALIASES = {
@@ -29,33 +79,137 @@ def validate_location(location: str) -> tuple[bool, str]:
     """
     location_lower = location.lower().strip()
     
-    # Check if it's a special case (Remote, Worldwide)
-    if location_lower in ["remote", "worldwide"]:
-        return True, location_lower.capitalize()
+    # Special cases (Remote, Worldwide) are normalized to their display form
+    alias = LOCATION_ALIASES.get(location_lower)
+    if alias is not None:
+        return True, alias
     
-    # Check against valid countries
-    if location_lower in VALID_COUNTRIES:
-        return True, location
+    return location_lower in VALID_COUNTRIES, location
+
+
+@lru_cache(maxsize=4096)
+def parse_keywords(keywords: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated keywords string, dropping blank entries.
+    The tuple is hashable, so repeated queries reuse the parsed result.
+    """
+    return tuple(k for k in (part.strip() for part in keywords.split(",")) if k)
+
+
+def invalid_location_response(keywords: List[str], location: str) -> dict:
+    """
+    Build the error response returned for an unsupported location.
+    """
+    return {
+        "status": "error",
+        "error": f"Invalid location: '{location}'",
+        "message": f"'{location}' is not a supported location. Valid locations include: {_ERROR_HINT}... and more",
+        "valid_locations": _SORTED_COUNTRIES,
+        "total_jobs": 0,
+        "keywords": keywords,
+        "location": location,
+        "jobs": []
+    }
+
+
+def _build_response(keywords: List[str], location: str, all_jobs: List[dict]) -> dict:
+    """
+    Build the final response for a completed scrape.
+    """
+    response = {
+        "status": "success" if all_jobs else "no_results",
+        "total_jobs": len(all_jobs),
+        "keywords": keywords,
+        "location": location,
+        "jobs": all_jobs
+    }
     
-    return False, location
+    return response
 
 
-def clean_nan_values(data):
+def _add_unique_jobs(all_jobs: List[dict], seen: set, jobs_list: List[dict]) -> None:
     """
-    Recursively clean NaN and inf values from data structures.
-    Converts them to None (which JSON can handle).
+    Append jobs not seen before, keyed by job_url or (title, company, location).
+    The same posting often comes back for overlapping keywords and sites.
     """
-    if isinstance(data, dict):
-        return {key: clean_nan_values(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [clean_nan_values(item) for item in data]
-    elif isinstance(data, float):
-        if np.isnan(data) or np.isinf(data):
-            return None
-        return data
-    elif pd.isna(data):
-        return None
-    return data
+    for job in jobs_list:
+        key = job.get("job_url") or (job.get("title"), job.get("company"), job.get("location"))
+        if key in seen:
+            continue
+        seen.add(key)
+        all_jobs.append(job)
+
+
+def _scrape_records(
+    keyword: str,
+    location: str,
+    results_wanted: int,
+    hours_old: int,
+    site_names: List[str]
+) -> List[dict]:
+    """
+    Scrape a single keyword across the given sites and return clean job records.
+    Errors from jobspy are raised to the caller.
+    """
+    logger.info("Scraping jobs for keyword: %s (%s)", keyword, ", ".join(site_names))
+    
+    jobs_df = scrape_jobs(
+        site_name=site_names,
+        search_term=keyword,
+        location=location,
+        results_wanted=results_wanted,
+        hours_old=hours_old
+    )
+    
+    if jobs_df.empty:
+        logger.info("No jobs found for '%s'", keyword)
+        return []
+    
+    # inf can only appear in numeric columns; when it does, map it to NaN so the
+    # single to_numpy pass below turns both into None
+    numeric = jobs_df.select_dtypes(include="number").to_numpy(dtype=float, na_value=np.nan)
+    if np.isinf(numeric).any():
+        jobs_df = jobs_df.replace([np.inf, -np.inf], np.nan)
+    
+    # Convert rows straight from NumPy to dictionaries, skipping to_dict's per-row overhead
+    columns = jobs_df.columns.tolist()
+    rows = jobs_df.to_numpy(dtype=object, na_value=None).tolist()
+    jobs_list = [dict(zip(columns, row)) for row in rows]
+    
+    logger.info("Found %d jobs for '%s'", len(jobs_list), keyword)
+    return jobs_list
+
+
+def _value_error_message(error: ValueError, location: str) -> str:
+    """
+    Describe a jobspy ValueError, calling out unsupported locations explicitly.
+    """
+    error_msg = str(error)
+    if "Invalid country" in error_msg or "Valid countries" in error_msg:
+        return f"Invalid location '{location}'"
+    return error_msg
+
+
+def _scrape_one(
+    keyword: str,
+    location: str,
+    results_wanted: int,
+    hours_old: int,
+    site_names: List[str]
+) -> List[dict]:
+    """
+    Scrape a single keyword across all sites.
+    Errors are logged and produce an empty list, so one failing
+    keyword never aborts the rest of the batch.
+    """
+    try:
+        return _scrape_records(keyword, location, results_wanted, hours_old, site_names)
+    except ValueError as e:
+        logger.error("Error scraping jobs for '%s': %s", keyword, _value_error_message(e, location))
+        return []
+    except Exception as e:
+        logger.error("Error scraping jobs for '%s': %s", keyword, e)
+        return []
 
 
 def scrape_jobs_by_keyword(
@@ -68,175 +222,313 @@ def scrape_jobs_by_keyword(
 
     
     if site_names is None:
-        site_names = ["linkedin", "indeed","glassdoor", "zip_recruiter", "google"]
+        site_names = DEFAULT_SITE_NAMES
     
     # Validate location
     is_valid, normalized_location = validate_location(location)
     if not is_valid:
-        return {
-            "status": "error",
-            "error": f"Invalid location: '{location}'",
-            "message": f"'{location}' is not a supported location. Valid locations include: {', '.join(sorted(list(VALID_COUNTRIES)[:20]))}... and more",
-            "valid_locations": sorted(list(VALID_COUNTRIES)),
-            "total_jobs": 0,
-            "keywords": keywords,
-            "location": location,
-            "jobs": []
-        }
+        return invalid_location_response(keywords, location)
     
     all_jobs = []
+    seen = set()
     
-    for keyword in keywords:
-        try:
-            print(f"Scraping jobs for keyword: {keyword}", file=sys.stderr)
-            
-            jobs_df = scrape_jobs(
-                site_name=site_names,
-                search_term=keyword,
-                location=normalized_location,
-                results_wanted=results_wanted,
-                hours_old=hours_old
-            )
-            
-            if not jobs_df.empty:
-                # Fill NaN values with None before converting to dict
-                jobs_df = jobs_df.where(pd.notna(jobs_df), None)
-                
-                # Convert DataFrame to list of dictionaries
-                jobs_list = jobs_df.to_dict(orient="records")
-                
-                # Clean any remaining NaN values
-                jobs_list = [clean_nan_values(job) for job in jobs_list]
-                
-                all_jobs.extend(jobs_list)
-                print(f"Found {len(jobs_list)} jobs for '{keyword}'", file=sys.stderr)
-            else:
-                print(f"No jobs found for '{keyword}'", file=sys.stderr)
-        
-        except ValueError as e:
-            error_msg = str(e)
-            if "Invalid country" in error_msg or "Valid countries" in error_msg:
-                print(f"Error scraping jobs for '{keyword}': Invalid location '{normalized_location}'", file=sys.stderr)
-            else:
-                print(f"Error scraping jobs for '{keyword}': {error_msg}", file=sys.stderr)
-            continue
-        except Exception as e:
-            print(f"Error scraping jobs for '{keyword}': {str(e)}", file=sys.stderr)
-            continue
-    
-    # Final cleanup of the entire response
-    response = {
-        "status": "success" if all_jobs else "no_results",
-        "total_jobs": len(all_jobs),
-        "keywords": keywords,
-        "location": normalized_location,
-        "jobs": all_jobs
-    }
+    # Keywords are scraped in parallel threads and merged back in keyword order.
+    # The whole batch shares one deadline of SCRAPE_TIMEOUT per round of workers
+    # (ceil(keywords / workers) rounds); keywords not finished by then are skipped.
+    # A hung scrape holds its worker, so keywords queued behind it get less time.
+    # jobspy scrapes a keyword's sites concurrently, so SCRAPE_TIMEOUT per keyword
+    # matches the async path's per-site attempt budget; there are no retries here.
+    workers = min(MAX_KEYWORD_WORKERS, len(keywords)) or 1
+    deadline = time.monotonic() + SCRAPE_TIMEOUT * -(-len(keywords) // workers)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(_scrape_one, keyword, normalized_location, results_wanted, hours_old, site_names)
+            for keyword in keywords
+        ]
+        for keyword, future in zip(keywords, futures):
+            try:
+                jobs_list = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FuturesTimeoutError:
+                logger.error("Timed out scraping jobs for '%s'", keyword)
+                continue
+            _add_unique_jobs(all_jobs, seen, jobs_list)
+    finally:
+        # Don't wait on timed-out scrapes; keywords that never started are cancelled
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    return clean_nan_values(response)
+    return _build_response(keywords, normalized_location, all_jobs)
 
 
-def main():
+class RateLimiter:
     """
-    Command-line interface for the job scraper.
-    Usage: python scraper.py "<keyword1>,<keyword2>" "<location>" [results] [hours_old]
-    
-    Example:
-        python scraper.py "Software Engineer,Python Developer" "Remote" 50 24
-        python scraper.py "DevOps Engineer" "New York, NY"
+    Token bucket limiting how many scrapes may start per second against one site.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available, then take it.
+        """
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+_rate_limiters = {}
+_site_semaphores = weakref.WeakKeyDictionary()
+
+
+def _site_limiters(site: str) -> tuple[asyncio.Semaphore, RateLimiter]:
+    """
+    Return the concurrency cap and rate limiter for site.
+    Semaphores are kept per event loop, since asyncio primitives can't be shared across loops.
     """
+    max_concurrent, rate = SITE_LIMITS.get(site, DEFAULT_SITE_LIMIT)
     
-    if len(sys.argv) < 2:
-        print("Usage: python scraper.py \"<keyword1>,<keyword2>\" \"<location>\" [results] [hours_old]", file=sys.stderr)
-        print("\nValid countries: Remote, USA, Canada, UK, etc.", file=sys.stderr)
-        sys.exit(1)
+    if site not in _rate_limiters:
+        _rate_limiters[site] = RateLimiter(rate, burst=max_concurrent)
     
-    # Parse command-line arguments
-    keywords_str = sys.argv[1]
-    location = sys.argv[2] if len(sys.argv) > 2 else "Remote"
-    results_wanted = int(sys.argv[3]) if len(sys.argv) > 3 else 50
-    hours_old = int(sys.argv[4]) if len(sys.argv) > 4 else 24
+    semaphores = _site_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if site not in semaphores:
+        semaphores[site] = asyncio.Semaphore(max_concurrent)
     
-    # Split keywords by comma
-    keywords = [k.strip() for k in keywords_str.split(",")]
+    return semaphores[site], _rate_limiters[site]
+
+
+async def _run_scrape_in_thread(
+    sem: asyncio.Semaphore,
+    keyword: str,
+    site: str,
+    location: str,
+    results_wanted: int,
+    hours_old: int
+) -> Optional[List[dict]]:
+    """
+    Run _scrape_records for one (keyword, site) pair on the scrape pool,
+    within the site's concurrency and rate limits and the request's sem.
+    sem is only taken once the site lets the scrape start, so scrapes queued
+    behind a site's cap don't hold the request's slots.
+    The site slot is held until the thread finishes, even after a timeout, so
+    abandoned scrapes of a hung board keep counting against its cap instead
+    of filling the pool. Waiting for a slot and for a thread are each bounded
+    by SCRAPE_TIMEOUT, and the scrape gets SCRAPE_TIMEOUT from when its thread starts.
+    Returns None if any of these time out.
+    """
+    site_sem, rate_limiter = _site_limiters(site)
+    loop = asyncio.get_running_loop()
+    started = asyncio.Event()
     
-    # Scrape jobs
-    result = scrape_jobs_by_keyword(
-        keywords=keywords,
-        location=location,
-        results_wanted=results_wanted,
-        hours_old=hours_old
-    )
+    def run() -> List[dict]:
+        loop.call_soon_threadsafe(started.set)
+        return _scrape_records(keyword, location, results_wanted, hours_old, [site])
     
-    # Output as JSON to stdout
-    print(json.dumps(result, indent=2, default=str))
+    def release_site(_) -> None:
+        # The loop may already be closed when an abandoned scrape finishes
+        try:
+            loop.call_soon_threadsafe(site_sem.release)
+        except RuntimeError:
+            pass
+    
+    # A hung board keeps its slots until its threads return, so don't wait on them forever
+    try:
+        async with asyncio.timeout(SCRAPE_TIMEOUT):
+            await site_sem.acquire()
+    except asyncio.TimeoutError:
+        return None
+    try:
+        await rate_limiter.acquire()
+        await sem.acquire()
+        try:
+            future = _SCRAPE_EXECUTOR.submit(run)
+        except BaseException:
+            sem.release()
+            raise
+    except BaseException:
+        site_sem.release()
+        raise
+    future.add_done_callback(release_site)
+    result = asyncio.wrap_future(future)
+    try:
+        async with asyncio.timeout(SCRAPE_TIMEOUT):
+            await started.wait()
+        await asyncio.wait({result}, timeout=SCRAPE_TIMEOUT)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        sem.release()
+        if not result.done():
+            # Drop the scrape if it is still queued; a running thread finishes on its own
+            result.cancel()
+    if result.cancelled():
+        return None
+    # Errors raised by the scrape itself, including its own TimeoutErrors, propagate
+    return result.result()
 
 
-if __name__ == "__main__":
-    main()
+async def _scrape_site(
+    sem: asyncio.Semaphore,
+    keyword: str,
+    site: str,
+    location: str,
+    results_wanted: int,
+    hours_old: int
+) -> List[dict]:
+    """
+    Scrape a single (keyword, site) pair on the scrape pool, bounded by sem
+    and by the site's own concurrency and rate limits.
+    Transient errors are retried with exponential backoff; an attempt that
+    can't start or finish within SCRAPE_TIMEOUT abandons the site instead of retrying it.
+    """
+    for attempt in range(SCRAPE_ATTEMPTS):
+        try:
+            jobs_list = await _run_scrape_in_thread(sem, keyword, site, location, results_wanted, hours_old)
+        except ValueError as e:
+            # Bad input (e.g. an unsupported location) fails the same way on every attempt
+            logger.error("Error scraping %s jobs for '%s': %s", site, keyword, _value_error_message(e, location))
+            return []
+        except Exception as e:
+            logger.warning("Error scraping %s jobs for '%s' (attempt %d/%d): %s", site, keyword, attempt + 1, SCRAPE_ATTEMPTS, e)
+            if attempt + 1 < SCRAPE_ATTEMPTS:
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+        else:
+            if jobs_list is None:
+                logger.error("Timed out scraping %s jobs for '%s' after %ss", site, keyword, SCRAPE_TIMEOUT)
+                return []
+            return jobs_list
+    
+    return []
 
 
-def main():
+def _create_scrape_tasks(
+    keywords: List[str],
+    location: str,
+    results_wanted: int,
+    hours_old: int,
+    site_names: List[str]
+) -> List[asyncio.Task]:
     """
-    Command-line interface for the job scraper.
-    Usage: python scraper.py "<keyword1>,<keyword2>" "<location>" [results] [hours_old]
+    Schedule one task per (keyword, site) pair, at most MAX_CONCURRENT_SCRAPES at a time.
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+    return [
+        asyncio.create_task(_scrape_site(sem, keyword, site, location, results_wanted, hours_old))
+        for keyword, site in product(keywords, site_names)
+    ]
+
+
+async def iter_jobs_by_keyword(
+    keywords: List[str],
+    location: str,
+    results_wanted: int = 50,
+    hours_old: int = 24,
+    site_names: Optional[List[str]] = None
+) -> AsyncIterator[List[dict]]:
+    """
+    Yield each (keyword, site) pair's new jobs as soon as its scrape finishes.
+    location must already be validated with validate_location. Scrapes that
+    haven't finished are cancelled if the consumer stops iterating early.
+    """
+    if site_names is None:
+        site_names = DEFAULT_SITE_NAMES
     
-    Example:
-        python scraper.py "Software Engineer,Python Developer" "Remote" 50 24
-        python scraper.py "DevOps Engineer" "New York, NY"
+    tasks = _create_scrape_tasks(keywords, location, results_wanted, hours_old, site_names)
+    seen = set()
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            jobs_list = []
+            _add_unique_jobs(jobs_list, seen, await next_done)
+            yield jobs_list
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def scrape_jobs_by_keyword_async(
+    keywords: List[str],
+    location: str = "Remote",
+    results_wanted: int = 50,
+    hours_old: int = 24,
+    site_names: Optional[List[str]] = None
+) -> dict:
     """
+    Async variant of scrape_jobs_by_keyword for the API.
+    Every (keyword, site) pair is scraped as its own task in a worker thread,
+    so the whole request takes roughly as long as its slowest single scrape
+    and the event loop stays free for other requests.
+    """
+    if site_names is None:
+        site_names = DEFAULT_SITE_NAMES
     
-    if len(sys.argv) < 2:
-        print("Usage: python scraper.py \"<keyword1>,<keyword2>\" \"<location>\" [results] [hours_old]", file=sys.stderr)
-        sys.exit(1)
+    # Validate location
+    is_valid, normalized_location = validate_location(location)
+    if not is_valid:
+        return invalid_location_response(keywords, location)
     
-    # Parse command-line arguments
-    keywords_str = sys.argv[1]
-    location = sys.argv[2] if len(sys.argv) > 2 else "Remote"
-    results_wanted = int(sys.argv[3]) if len(sys.argv) > 3 else 50
-    hours_old = int(sys.argv[4]) if len(sys.argv) > 4 else 24
+    tasks = _create_scrape_tasks(keywords, normalized_location, results_wanted, hours_old, site_names)
+    results = await asyncio.gather(*tasks)
     
-    # Split keywords by comma
-    keywords = [k.strip() for k in keywords_str.split(",")]
+    all_jobs = []
+    seen = set()
     
-    # Scrape jobs
-    result = scrape_jobs_by_keyword(
-        keywords=keywords,
-        location=location,
-        results_wanted=results_wanted,
-        hours_old=hours_old
-    )
+    for jobs_list in results:
+        _add_unique_jobs(all_jobs, seen, jobs_list)
     
-    # Output as JSON to stdout
-    print(json.dumps(result, indent=2, default=str))
+    return _build_response(keywords, normalized_location, all_jobs)
 
 
-if __name__ == "__main__":
-    main()
+def json_default(obj):
+    """
+    Serialize values orjson doesn't handle natively.
+    Dates and datetimes (including pandas Timestamps) use ISO 8601; anything else falls back to str().
+    """
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return str(obj)
 
 
 def main():
     """
     Command-line interface for the job scraper.
-    Usage: python scraper.py "<keyword1>,<keyword2>" "<location>" [results] [hours_old]
+    Usage: python scraper.py "<keyword1>,<keyword2>" "<location>" [results] [hours_old] [--pretty]
+    
+    Output is compact JSON by default; pass --pretty for indented output.
     
     Example:
         python scraper.py "Software Engineer,Python Developer" "Remote" 50 24
-        python scraper.py "DevOps Engineer" "New York, NY"
+        python scraper.py "DevOps Engineer" "New York, NY" --pretty
     """
     
-    if len(sys.argv) < 2:
-        print("Usage: python scraper.py \"<keyword1>,<keyword2>\" \"<location>\" [results] [hours_old]", file=sys.stderr)
+    # --pretty may appear anywhere; everything else is positional
+    args = [arg for arg in sys.argv[1:] if arg != "--pretty"]
+    pretty = len(args) != len(sys.argv) - 1
+    
+    if len(args) < 1:
+        print("Usage: python scraper.py \"<keyword1>,<keyword2>\" \"<location>\" [results] [hours_old] [--pretty]", file=sys.stderr)
+        print("\nValid countries: Remote, USA, Canada, UK, etc.", file=sys.stderr)
         sys.exit(1)
     
+    # Report scraping progress on stderr
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+    
     # Parse command-line arguments
-    keywords_str = sys.argv[1]
-    location = sys.argv[2] if len(sys.argv) > 2 else "Remote"
-    results_wanted = int(sys.argv[3]) if len(sys.argv) > 3 else 50
-    hours_old = int(sys.argv[4]) if len(sys.argv) > 4 else 24
+    keywords_str = args[0]
+    location = args[1] if len(args) > 1 else "Remote"
+    results_wanted = int(args[2]) if len(args) > 2 else 50
+    hours_old = int(args[3]) if len(args) > 3 else 24
     
-    # Split keywords by comma
-    keywords = [k.strip() for k in keywords_str.split(",")]
+    # Split keywords by comma, the same way the API does
+    keywords = parse_keywords(keywords_str)
     
     # Scrape jobs
     result = scrape_jobs_by_keyword(
@@ -247,7 +539,10 @@ def main():
     )
     
     # Output as JSON to stdout
-    print(json.dumps(result, indent=2, default=str))
+    option = orjson.OPT_SERIALIZE_NUMPY
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    sys.stdout.buffer.write(orjson.dumps(result, default=json_default, option=option) + b"\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,9 @@
+from uvicorn.workers import UvicornWorker
+
+
+class UvloopWorker(UvicornWorker):
+    """
+    Gunicorn worker that requires uvloop and httptools.
+    UvicornWorker defaults to "auto", which silently falls back to asyncio and h11.
+    """
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}